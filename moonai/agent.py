@@ -7,6 +7,8 @@ from pydantic import Field, InstanceOf, PrivateAttr, model_validator
 
 from moonai.agents import CacheHandler
 from moonai.agents.agent_builder.base_agent import BaseAgent
+from moonai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from moonai.agents.agent_builder.utilities.usage_budget import UsageBudget
 from moonai.agents.squad_agent_executor import SquadAgentExecutor
 from moonai.cli.constants import ENV_VARS
 from moonai.llm import LLM
@@ -367,9 +369,32 @@ class Agent(BaseAgent):
             request_within_rpm_limit=(
                 self._rpm_controller.check_or_wait if self._rpm_controller else None
             ),
-            callbacks=[TokenCalcHandler(self._token_process)],
+            callbacks=[
+                TokenCalcHandler(
+                    self._token_process,
+                    linked_processes=self._linked_token_processes(mission),
+                )
+            ],
+            usage_budgets=self._usage_budgets(mission),
         )
 
+    def _linked_token_processes(self, mission=None) -> List[TokenProcess]:
+        """Token processes of the mission and squad sharing this agent's usage."""
+        processes = []
+        if mission is not None and hasattr(mission, "_token_process"):
+            processes.append(mission._token_process)
+        if self.squad is not None and hasattr(self.squad, "_token_process"):
+            processes.append(self.squad._token_process)
+        return processes
+
+    def _usage_budgets(self, mission=None) -> List[UsageBudget]:
+        """Budgets the executor must respect, from the agent, mission and squad."""
+        budgets = [self.usage_budget]
+        for owner in (mission, self.squad):
+            if owner is not None and hasattr(owner, "usage_budget"):
+                budgets.append(owner.usage_budget)
+        return [budget for budget in budgets if budget.is_limited]
+
     def get_delegation_tools(self, agents: List[BaseAgent]):
         agent_tools = AgentTools(agents=agents)
         tools = agent_tools.tools()
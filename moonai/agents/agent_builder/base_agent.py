@@ -16,6 +16,7 @@ from pydantic import (
 from pydantic_core import PydanticCustomError
 
 from moonai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from moonai.agents.agent_builder.utilities.usage_budget import UsageBudget
 from moonai.agents.cache.cache_handler import CacheHandler
 from moonai.agents.tools_handler import ToolsHandler
 from moonai.tools import BaseTool
@@ -47,6 +48,8 @@ class BaseAgent(ABC, BaseModel):
         cache_handler (InstanceOf[CacheHandler]): An instance of the CacheHandler class.
         tools_handler (InstanceOf[ToolsHandler]): An instance of the ToolsHandler class.
         max_tokens: Maximum number of tokens for the agent to generate in a response.
+        token_budget: Maximum number of tokens the agent may consume across its missions.
+        cost_budget: Maximum cost in USD the agent may spend across its missions.
 
 
     Methods:
@@ -129,6 +132,14 @@ class BaseAgent(ABC, BaseModel):
     max_tokens: Optional[int] = Field(
         default=None, description="Maximum number of tokens for the agent's execution."
     )
+    token_budget: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tokens the agent may consume across its missions.",
+    )
+    cost_budget: Optional[float] = Field(
+        default=None,
+        description="Maximum cost in USD the agent may spend across its missions.",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -175,6 +186,16 @@ class BaseAgent(ABC, BaseModel):
             self._token_process = TokenProcess()
         return self
 
+    @property
+    def usage_budget(self) -> UsageBudget:
+        """Budget tracking the token usage and cost of the agent."""
+        return UsageBudget(
+            scope="agent",
+            token_process=self._token_process,
+            max_tokens=self.token_budget,
+            max_cost=self.cost_budget,
+        )
+
     @property
     def key(self):
         source = [
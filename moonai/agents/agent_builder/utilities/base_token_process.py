@@ -1,32 +1,49 @@
+import threading
+
 from moonai.types.usage_metrics import UsageMetrics
 
 
 class TokenProcess:
-    total_tokens: int = 0
-    prompt_tokens: int = 0
-    cached_prompt_tokens: int = 0
-    completion_tokens: int = 0
-    successful_requests: int = 0
+    """Thread-safe accumulator for the token usage and cost of LLM calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total_tokens: int = 0
+        self.prompt_tokens: int = 0
+        self.cached_prompt_tokens: int = 0
+        self.completion_tokens: int = 0
+        self.successful_requests: int = 0
+        self.total_cost: float = 0.0
 
     def sum_prompt_tokens(self, tokens: int):
-        self.prompt_tokens = self.prompt_tokens + tokens
-        self.total_tokens = self.total_tokens + tokens
+        with self._lock:
+            self.prompt_tokens = self.prompt_tokens + tokens
+            self.total_tokens = self.total_tokens + tokens
 
     def sum_completion_tokens(self, tokens: int):
-        self.completion_tokens = self.completion_tokens + tokens
-        self.total_tokens = self.total_tokens + tokens
+        with self._lock:
+            self.completion_tokens = self.completion_tokens + tokens
+            self.total_tokens = self.total_tokens + tokens
 
     def sum_cached_prompt_tokens(self, tokens: int):
-        self.cached_prompt_tokens = self.cached_prompt_tokens + tokens
+        with self._lock:
+            self.cached_prompt_tokens = self.cached_prompt_tokens + tokens
 
     def sum_successful_requests(self, requests: int):
-        self.successful_requests = self.successful_requests + requests
+        with self._lock:
+            self.successful_requests = self.successful_requests + requests
+
+    def sum_cost(self, cost: float):
+        with self._lock:
+            self.total_cost = self.total_cost + cost
 
     def get_summary(self) -> UsageMetrics:
-        return UsageMetrics(
-            total_tokens=self.total_tokens,
-            prompt_tokens=self.prompt_tokens,
-            cached_prompt_tokens=self.cached_prompt_tokens,
-            completion_tokens=self.completion_tokens,
-            successful_requests=self.successful_requests,
-        )
+        with self._lock:
+            return UsageMetrics(
+                total_tokens=self.total_tokens,
+                prompt_tokens=self.prompt_tokens,
+                cached_prompt_tokens=self.cached_prompt_tokens,
+                completion_tokens=self.completion_tokens,
+                successful_requests=self.successful_requests,
+                total_cost=self.total_cost,
+            )
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from moonai.agents.agent_builder.utilities.base_token_process import TokenProcess
+
+
+class UsageBudget:
+    """Token and cost limits checked against the usage of a TokenProcess.
+
+    Attributes:
+        scope: What the budget applies to, e.g. "squad", "mission" or "agent".
+        token_process: The process accumulating the usage for that scope.
+        max_tokens: Maximum number of tokens, None for no limit.
+        max_cost: Maximum cost in USD, None for no limit.
+    """
+
+    def __init__(
+        self,
+        scope: str,
+        token_process: TokenProcess,
+        max_tokens: Optional[int] = None,
+        max_cost: Optional[float] = None,
+    ):
+        self.scope = scope
+        self.token_process = token_process
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+
+    @property
+    def is_limited(self) -> bool:
+        return self.max_tokens is not None or self.max_cost is not None
+
+    def is_exceeded(self) -> bool:
+        if self.max_tokens is not None and (
+            self.token_process.total_tokens >= self.max_tokens
+        ):
+            return True
+        if self.max_cost is not None and self.token_process.total_cost >= self.max_cost:
+            return True
+        return False
+
+    def describe(self) -> str:
+        limits = []
+        if self.max_tokens is not None:
+            limits.append(
+                f"{self.token_process.total_tokens}/{self.max_tokens} tokens"
+            )
+        if self.max_cost is not None:
+            limits.append(f"${self.token_process.total_cost:.4f}/${self.max_cost:.4f}")
+        return f"{self.scope} budget: {', '.join(limits)}"
@@ -1,9 +1,10 @@
 import json
 import re
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from moonai.agents.agent_builder.base_agent import BaseAgent
 from moonai.agents.agent_builder.base_agent_executor_mixin import SquadAgentExecutorMixin
+from moonai.agents.agent_builder.utilities.usage_budget import UsageBudget
 from moonai.agents.parser import (
     FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE,
     AgentAction,
@@ -44,6 +45,7 @@ class SquadAgentExecutor(SquadAgentExecutorMixin):
         respect_context_window: bool = False,
         request_within_rpm_limit: Any = None,
         callbacks: List[Any] = [],
+        usage_budgets: List[UsageBudget] = [],
     ):
         self._i18n: I18N = I18N()
         self.llm = llm
@@ -56,6 +58,7 @@ class SquadAgentExecutor(SquadAgentExecutorMixin):
         self.stop = stop_words
         self.max_iter = max_iter
         self.callbacks = callbacks
+        self.usage_budgets = usage_budgets
         self._printer: Printer = Printer()
         self.tools_handler = tools_handler
         self.original_tools = original_tools
@@ -113,6 +116,10 @@ class SquadAgentExecutor(SquadAgentExecutorMixin):
     def _invoke_loop(self, formatted_answer=None):
         try:
             while not isinstance(formatted_answer, AgentFinish):
+                exceeded_budget = self._exceeded_budget()
+                if exceeded_budget:
+                    return self._finish_over_budget(exceeded_budget, formatted_answer)
+
                 if not self.request_within_rpm_limit or self.request_within_rpm_limit():
                     answer = self.llm.call(
                         self.messages,
@@ -189,6 +196,32 @@ class SquadAgentExecutor(SquadAgentExecutorMixin):
         self._show_logs(formatted_answer)
         return formatted_answer
 
+    def _exceeded_budget(self) -> Optional[UsageBudget]:
+        return next(
+            (budget for budget in self.usage_budgets if budget.is_exceeded()), None
+        )
+
+    def _finish_over_budget(
+        self,
+        budget: UsageBudget,
+        formatted_answer: Optional[Union[AgentAction, AgentFinish]],
+    ) -> AgentFinish:
+        """Stop the loop and return whatever the agent produced so far."""
+        self._printer.print(
+            content=f"Usage limit reached, stopping the agent: {budget.describe()}",
+            color="red",
+        )
+        partial = formatted_answer.text if formatted_answer else ""
+        formatted_answer = AgentFinish(
+            thought="",
+            output=self._i18n.errors("budget_exceeded").format(
+                budget=budget.describe(), partial=partial
+            ),
+            text=partial,
+        )
+        self._show_logs(formatted_answer)
+        return formatted_answer
+
     def _show_start_logs(self):
         if self.agent is None:
             raise ValueError("Agent cannot be None")
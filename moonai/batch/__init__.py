@@ -0,0 +1,16 @@
+from .base_batch_backend import BaseBatchBackend, BatchRequest, BatchResponse
+from .batch_coordinator import BatchCoordinator
+from .batch_llm import BatchLLM, BatchLLMError
+from .litellm_batch_backend import LiteLLMBatchBackend
+from .local_file_batch_backend import LocalFileBatchBackend
+
+__all__ = [
+    "BaseBatchBackend",
+    "BatchCoordinator",
+    "BatchLLM",
+    "BatchLLMError",
+    "BatchRequest",
+    "BatchResponse",
+    "LiteLLMBatchBackend",
+    "LocalFileBatchBackend",
+]
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BatchRequest(BaseModel):
+    """A single chat completion waiting to be sent as part of a batch."""
+
+    custom_id: str = Field(description="Identifier used to match the response.")
+    params: Dict[str, Any] = Field(
+        description="litellm completion parameters, as built by LLM.completion_params."
+    )
+
+
+class BatchResponse(BaseModel):
+    """The outcome of a single request of a batch."""
+
+    custom_id: str = Field(description="Identifier of the originating request.")
+    content: Optional[str] = Field(
+        default=None, description="Content of the assistant message."
+    )
+    usage: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Token usage reported for the request (prompt_tokens, completion_tokens, total_tokens).",
+    )
+    cost: Optional[float] = Field(
+        default=None,
+        description="Cost in USD reported by the backend, priced from litellm's model cost metadata when missing.",
+    )
+    error: Optional[str] = Field(
+        default=None, description="Error message if the request failed."
+    )
+
+
+class BaseBatchBackend(ABC):
+    """Abstract base class for batch completion backends."""
+
+    @abstractmethod
+    def submit(self, requests: List[BatchRequest]) -> str:
+        """Submit the requests as one batch and return its id."""
+        pass
+
+    @abstractmethod
+    def wait(self, batch_id: str) -> List[BatchResponse]:
+        """Block until the batch is completed and return its responses."""
+        pass
+
+    @staticmethod
+    def _request_body(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Strip the parameters that must not leave the process or are not part of a completion body."""
+        excluded = {"api_key", "api_base", "api_version", "timeout", "stream"}
+        return {k: v for k, v in params.items() if k not in excluded}
@@ -0,0 +1,79 @@
+import threading
+import uuid
+from typing import Any, Dict, List
+
+from moonai.batch.base_batch_backend import BaseBatchBackend, BatchRequest, BatchResponse
+
+
+class BatchCoordinator:
+    """
+    Collects the pending LLM request of every participant and sends them as one batch.
+
+    Each participant (usually one squad kickoff running in its own thread) blocks
+    in `request` until every active participant is either waiting on a request
+    or has left. The collected requests are then submitted to the backend and all
+    participants are released with their response, advancing together.
+    """
+
+    def __init__(self, backend: BaseBatchBackend, participants: int) -> None:
+        self.backend = backend
+        self._condition = threading.Condition()
+        self._active = participants
+        self._pending: List[BatchRequest] = []
+        self._responses: Dict[str, BatchResponse] = {}
+        self._flushing = False
+
+    def request(self, params: Dict[str, Any]) -> BatchResponse:
+        """Queue a completion and block until the batch containing it is done."""
+        with self._condition:
+            request = BatchRequest(custom_id=uuid.uuid4().hex, params=params)
+            self._pending.append(request)
+            self._flush_if_ready()
+            while request.custom_id not in self._responses:
+                self._condition.wait()
+            return self._responses.pop(request.custom_id)
+
+    def leave(self) -> None:
+        """Mark a participant as finished so the others no longer wait on it."""
+        with self._condition:
+            self._active -= 1
+            self._flush_if_ready()
+
+    def _flush_if_ready(self) -> None:
+        # Must be called with the condition held. The lock is released while the
+        # backend runs so finishing participants can still leave.
+        while (
+            not self._flushing
+            and self._pending
+            and len(self._pending) >= self._active
+        ):
+            batch, self._pending = self._pending, []
+            self._flushing = True
+            self._condition.release()
+            try:
+                responses = self._run_batch(batch)
+            finally:
+                self._condition.acquire()
+                self._flushing = False
+
+            for response in responses:
+                self._responses[response.custom_id] = response
+            self._condition.notify_all()
+
+    def _run_batch(self, batch: List[BatchRequest]) -> List[BatchResponse]:
+        try:
+            batch_id = self.backend.submit(batch)
+            responses = {r.custom_id: r for r in self.backend.wait(batch_id)}
+        except Exception as e:
+            return [BatchResponse(custom_id=r.custom_id, error=str(e)) for r in batch]
+
+        return [
+            responses.get(
+                request.custom_id,
+                BatchResponse(
+                    custom_id=request.custom_id,
+                    error="No response returned by the batch backend.",
+                ),
+            )
+            for request in batch
+        ]
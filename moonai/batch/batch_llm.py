@@ -0,0 +1,65 @@
+from typing import Any, Dict, List
+
+import litellm
+from litellm.types.utils import Usage
+
+from moonai.batch.base_batch_backend import BatchResponse
+from moonai.batch.batch_coordinator import BatchCoordinator
+from moonai.llm import LLM
+
+
+class BatchLLMError(Exception):
+    """Exception raised when a batched completion fails."""
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
+class BatchLLM(LLM):
+    """LLM that sends its completions through a BatchCoordinator instead of calling the provider directly."""
+
+    def __init__(self, llm: LLM, coordinator: BatchCoordinator):
+        settings = {k: v for k, v in vars(llm).items() if k != "kwargs"}
+        super().__init__(**settings, **llm.kwargs)
+        self.coordinator = coordinator
+
+    def call(self, messages: List[Dict[str, str]], callbacks: List[Any] = []) -> str:
+        response = self.coordinator.request(self.completion_params(messages))
+        if response.error:
+            raise BatchLLMError(response.error)
+
+        self._report_usage(response, callbacks or self.callbacks)
+        return response.content or ""
+
+    def _report_usage(self, response: BatchResponse, callbacks: List[Any]) -> None:
+        """Feed the batch usage to the token callbacks, as litellm would for a direct call."""
+        if not response.usage:
+            return
+
+        usage = Usage(
+            prompt_tokens=response.usage.get("prompt_tokens", 0),
+            completion_tokens=response.usage.get("completion_tokens", 0),
+            total_tokens=response.usage.get("total_tokens", 0),
+        )
+        cost = response.cost
+        if cost is None:
+            # List price, the actual batch price is usually lower.
+            try:
+                prompt_cost, completion_cost = litellm.cost_per_token(
+                    model=self.model,
+                    prompt_tokens=usage.prompt_tokens,
+                    completion_tokens=usage.completion_tokens,
+                )
+                cost = prompt_cost + completion_cost
+            except Exception:
+                cost = 0.0
+
+        for callback in callbacks:
+            if hasattr(callback, "log_success_event"):
+                callback.log_success_event(
+                    kwargs={"model": self.model, "response_cost": cost},
+                    response_obj={"usage": usage},
+                    start_time=None,
+                    end_time=None,
+                )
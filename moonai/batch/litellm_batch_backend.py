@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from moonai.batch.base_batch_backend import BaseBatchBackend, BatchRequest, BatchResponse
+
+FINAL_BATCH_STATUSES = ["completed", "failed", "expired", "cancelled"]
+
+
+class LiteLLMBatchBackend(BaseBatchBackend):
+    """
+    Batch backend using the provider batch APIs exposed by litellm
+    (`create_file`, `create_batch`, `retrieve_batch` and `file_content`).
+
+    Attributes:
+        custom_llm_provider: Provider hosting the batch, e.g. "openai" or "azure".
+        poll_interval: Seconds between two status checks while waiting.
+        completion_window: Completion window requested from the provider.
+    """
+
+    def __init__(
+        self,
+        custom_llm_provider: str = "openai",
+        poll_interval: float = 30.0,
+        completion_window: str = "24h",
+    ) -> None:
+        self.custom_llm_provider = custom_llm_provider
+        self.poll_interval = poll_interval
+        self.completion_window = completion_window
+
+    def submit(self, requests: List[BatchRequest]) -> str:
+        import litellm
+
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                for request in requests:
+                    file.write(json.dumps(self._batch_line(request), default=str) + "\n")
+
+            with open(path, "rb") as file:
+                input_file = litellm.create_file(
+                    file=file,
+                    purpose="batch",
+                    custom_llm_provider=self.custom_llm_provider,
+                )
+        finally:
+            os.remove(path)
+
+        batch = litellm.create_batch(
+            completion_window=self.completion_window,
+            endpoint="/v1/chat/completions",
+            input_file_id=input_file.id,
+            custom_llm_provider=self.custom_llm_provider,
+        )
+        return batch.id
+
+    def wait(self, batch_id: str) -> List[BatchResponse]:
+        import litellm
+
+        batch = litellm.retrieve_batch(
+            batch_id=batch_id, custom_llm_provider=self.custom_llm_provider
+        )
+        while batch.status not in FINAL_BATCH_STATUSES:
+            time.sleep(self.poll_interval)
+            batch = litellm.retrieve_batch(
+                batch_id=batch_id, custom_llm_provider=self.custom_llm_provider
+            )
+
+        if not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'.")
+
+        content = litellm.file_content(
+            file_id=batch.output_file_id,
+            custom_llm_provider=self.custom_llm_provider,
+        )
+        text = content.text if hasattr(content, "text") else content.content.decode()
+        return [self._parse_line(json.loads(line)) for line in text.splitlines() if line.strip()]
+
+    def _batch_line(self, request: BatchRequest) -> Dict[str, Any]:
+        body = self._request_body(request.params)
+        model = body.get("model", "")
+        if model.startswith(f"{self.custom_llm_provider}/"):
+            body["model"] = model.split("/", 1)[1]
+        return {
+            "custom_id": request.custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body,
+        }
+
+    def _parse_line(self, line: Dict[str, Any]) -> BatchResponse:
+        custom_id = line["custom_id"]
+        if line.get("error"):
+            return BatchResponse(custom_id=custom_id, error=str(line["error"]))
+
+        body = (line.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        if not choices:
+            return BatchResponse(custom_id=custom_id, error=f"Empty response: {body}")
+
+        usage = body.get("usage") or {}
+        return BatchResponse(
+            custom_id=custom_id,
+            content=choices[0]["message"]["content"],
+            usage={
+                "prompt_tokens": usage.get("prompt_tokens", 0),
+                "completion_tokens": usage.get("completion_tokens", 0),
+                "total_tokens": usage.get("total_tokens", 0),
+            },
+        )
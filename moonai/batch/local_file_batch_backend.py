@@ -0,0 +1,89 @@
+import json
+import os
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from moonai.batch.base_batch_backend import BaseBatchBackend, BatchRequest, BatchResponse
+from moonai.utilities.paths import db_storage_path
+
+
+class LocalFileBatchBackend(BaseBatchBackend):
+    """
+    Stand-in batch backend that keeps batches as JSONL files on disk.
+
+    Each batch is written to `<batch_id>.input.jsonl` on submit and processed
+    when waited on, writing `<batch_id>.output.jsonl`. Requests are answered by
+    `completion_fn`, which receives the request body and returns either the
+    message content or a dict with `content` and optionally `usage`. Without a
+    `completion_fn` each request is sent through `litellm.completion`.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        completion_fn: Optional[
+            Callable[[Dict[str, Any]], Union[str, Dict[str, Any]]]
+        ] = None,
+    ) -> None:
+        self.directory = directory or os.path.join(db_storage_path(), "batches")
+        self.completion_fn = completion_fn
+        os.makedirs(self.directory, exist_ok=True)
+
+    def submit(self, requests: List[BatchRequest]) -> str:
+        batch_id = f"batch_{uuid.uuid4().hex}"
+        with open(self._path(batch_id, "input"), "w", encoding="utf-8") as file:
+            for request in requests:
+                line = {
+                    "custom_id": request.custom_id,
+                    "body": self._request_body(request.params),
+                }
+                file.write(json.dumps(line, default=str) + "\n")
+        return batch_id
+
+    def wait(self, batch_id: str) -> List[BatchResponse]:
+        output_path = self._path(batch_id, "output")
+        if not os.path.exists(output_path):
+            self._process(batch_id)
+
+        with open(output_path, "r", encoding="utf-8") as file:
+            return [BatchResponse(**json.loads(line)) for line in file if line.strip()]
+
+    def _process(self, batch_id: str) -> None:
+        with open(self._path(batch_id, "input"), "r", encoding="utf-8") as file:
+            lines = [json.loads(line) for line in file if line.strip()]
+
+        responses = []
+        for line in lines:
+            try:
+                responses.append(
+                    BatchResponse(custom_id=line["custom_id"], **self._complete(line["body"]))
+                )
+            except Exception as e:
+                responses.append(BatchResponse(custom_id=line["custom_id"], error=str(e)))
+
+        with open(self._path(batch_id, "output"), "w", encoding="utf-8") as file:
+            for response in responses:
+                file.write(response.model_dump_json() + "\n")
+
+    def _complete(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        if self.completion_fn is None:
+            import litellm
+
+            response = litellm.completion(**body)
+            usage = response.get("usage")
+            return {
+                "content": response["choices"][0]["message"]["content"],
+                "usage": {
+                    "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+                    "completion_tokens": getattr(usage, "completion_tokens", 0),
+                    "total_tokens": getattr(usage, "total_tokens", 0),
+                },
+            }
+
+        result = self.completion_fn(body)
+        if isinstance(result, dict):
+            return result
+        return {"content": result}
+
+    def _path(self, batch_id: str, kind: str) -> str:
+        return os.path.join(self.directory, f"{batch_id}.{kind}.jsonl")
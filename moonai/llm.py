@@ -135,32 +135,7 @@ class LLM:
                 self.set_callbacks(callbacks)
 
             try:
-                params = {
-                    "model": self.model,
-                    "messages": messages,
-                    "timeout": self.timeout,
-                    "temperature": self.temperature,
-                    "top_p": self.top_p,
-                    "n": self.n,
-                    "stop": self.stop,
-                    "max_tokens": self.max_tokens or self.max_completion_tokens,
-                    "presence_penalty": self.presence_penalty,
-                    "frequency_penalty": self.frequency_penalty,
-                    "logit_bias": self.logit_bias,
-                    "response_format": self.response_format,
-                    "seed": self.seed,
-                    "logprobs": self.logprobs,
-                    "top_logprobs": self.top_logprobs,
-                    "api_base": self.base_url,
-                    "api_version": self.api_version,
-                    "api_key": self.api_key,
-                    "stream": False,
-                    **self.kwargs,
-                }
-
-                # Remove None values to avoid passing unnecessary parameters
-                params = {k: v for k, v in params.items() if v is not None}
-
+                params = self.completion_params(messages)
                 response = litellm.completion(**params)
                 return response["choices"][0]["message"]["content"]
             except Exception as e:
@@ -171,6 +146,34 @@ class LLM:
 
                 raise  # Re-raise the exception after logging
 
+    def completion_params(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Build the litellm completion parameters for the given messages."""
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "timeout": self.timeout,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "n": self.n,
+            "stop": self.stop,
+            "max_tokens": self.max_tokens or self.max_completion_tokens,
+            "presence_penalty": self.presence_penalty,
+            "frequency_penalty": self.frequency_penalty,
+            "logit_bias": self.logit_bias,
+            "response_format": self.response_format,
+            "seed": self.seed,
+            "logprobs": self.logprobs,
+            "top_logprobs": self.top_logprobs,
+            "api_base": self.base_url,
+            "api_version": self.api_version,
+            "api_key": self.api_key,
+            "stream": False,
+            **self.kwargs,
+        }
+
+        # Remove None values to avoid passing unnecessary parameters
+        return {k: v for k, v in params.items() if v is not None}
+
     def supports_function_calling(self) -> bool:
         try:
             params = get_supported_openai_params(model=self.model)
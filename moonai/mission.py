@@ -20,6 +20,8 @@ from pydantic import (
 from pydantic_core import PydanticCustomError
 
 from moonai.agents.agent_builder.base_agent import BaseAgent
+from moonai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from moonai.agents.agent_builder.utilities.usage_budget import UsageBudget
 from moonai.missions.output_format import OutputFormat
 from moonai.missions.mission_output import MissionOutput
 from moonai.telemetry.telemetry import Telemetry
@@ -46,6 +48,8 @@ class Mission(BaseModel):
         output_json: Pydantic model for structuring JSON output.
         output_pydantic: Pydantic model for mission output.
         tools: List of tools/resources limited for mission execution.
+        token_budget: Maximum number of tokens the mission execution may consume.
+        cost_budget: Maximum cost in USD the mission execution may spend.
     """
 
     __hash__ = object.__hash__  # type: ignore
@@ -110,6 +114,14 @@ class Mission(BaseModel):
         default=None,
     )
     processed_by_agents: Set[str] = Field(default_factory=set)
+    token_budget: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tokens the mission execution may consume.",
+    )
+    cost_budget: Optional[float] = Field(
+        default=None,
+        description="Maximum cost in USD the mission execution may spend.",
+    )
 
     _telemetry: Telemetry = PrivateAttr(default_factory=Telemetry)
     _execution_span: Optional[Span] = PrivateAttr(default=None)
@@ -117,6 +129,7 @@ class Mission(BaseModel):
     _original_expected_output: Optional[str] = PrivateAttr(default=None)
     _thread: Optional[threading.Thread] = PrivateAttr(default=None)
     _execution_time: Optional[float] = PrivateAttr(default=None)
+    _token_process: TokenProcess = PrivateAttr(default_factory=TokenProcess)
 
     @model_validator(mode="before")
     @classmethod
@@ -191,6 +204,16 @@ class Mission(BaseModel):
         """Execute the mission synchronously."""
         return self._execute_core(agent, context, tools)
 
+    @property
+    def usage_budget(self) -> UsageBudget:
+        """Budget tracking the token usage and cost of the current execution."""
+        return UsageBudget(
+            scope="mission",
+            token_process=self._token_process,
+            max_tokens=self.token_budget,
+            max_cost=self.cost_budget,
+        )
+
     @property
     def key(self) -> str:
         description = self._original_description or self.description
@@ -240,6 +263,7 @@ class Mission(BaseModel):
             )
 
         start_time = self._set_start_execution_time()
+        self._token_process = TokenProcess()
         self._execution_span = self._telemetry.mission_started(squad=agent.squad, mission=self)
 
         self.prompt_context = context
@@ -3,7 +3,7 @@ import json
 import os
 import uuid
 import warnings
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 from hashlib import md5
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
@@ -21,7 +21,10 @@ from pydantic_core import PydanticCustomError
 
 from moonai.agent import Agent
 from moonai.agents.agent_builder.base_agent import BaseAgent
+from moonai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from moonai.agents.agent_builder.utilities.usage_budget import UsageBudget
 from moonai.agents.cache import CacheHandler
+from moonai.batch import BaseBatchBackend, BatchCoordinator, BatchLLM
 from moonai.squads.squad_output import SquadOutput
 from moonai.llm import LLM
 from moonai.memory.entity.entity_memory import EntityMemory
@@ -84,6 +87,8 @@ class Squad(BaseModel):
         step_callback: Callback to be executed after each step for every agents execution.
         share_squad: Whether you want to share the complete squad information and execution with moonai to make the library better, and allow us to train models.
         planning: Plan the squad execution and add the plan to the squad.
+        token_budget: Maximum number of tokens a single kickoff may consume.
+        cost_budget: Maximum cost in USD a single kickoff may spend.
     """
 
     __hash__ = object.__hash__  # type: ignore
@@ -105,6 +110,7 @@ class Squad(BaseModel):
     _mission_output_handler: MissionOutputStorageHandler = PrivateAttr(
         default_factory=MissionOutputStorageHandler
     )
+    _token_process: TokenProcess = PrivateAttr(default_factory=TokenProcess)
 
     name: Optional[str] = Field(default=None)
     cache: bool = Field(default=True)
@@ -205,6 +211,14 @@ class Squad(BaseModel):
     knowledge: Optional[Dict[str, Any]] = Field(
         default=None, description="Knowledge for the squad. Add knowledge sources to the knowledge object."
     )
+    token_budget: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tokens a single kickoff may consume.",
+    )
+    cost_budget: Optional[float] = Field(
+        default=None,
+        description="Maximum cost in USD a single kickoff may spend.",
+    )
 
 
     @field_validator("id", mode="before")
@@ -425,6 +439,16 @@ class Squad(BaseModel):
                         )
         return self
 
+    @property
+    def usage_budget(self) -> UsageBudget:
+        """Budget tracking the token usage and cost of the current kickoff."""
+        return UsageBudget(
+            scope="squad",
+            token_process=self._token_process,
+            max_tokens=self.token_budget,
+            max_cost=self.cost_budget,
+        )
+
     @property
     def key(self) -> str:
         source = [agent.key for agent in self.agents] + [
@@ -509,6 +533,7 @@ class Squad(BaseModel):
         self._execution_span = self._telemetry.squad_execution_span(self, inputs)
         self._mission_output_handler.reset()
         self._logging_color = "bold_purple"
+        self._token_process = TokenProcess()
 
         if inputs is not None:
             self._inputs = inputs
@@ -558,8 +583,21 @@ class Squad(BaseModel):
 
         return result
 
-    def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[SquadOutput]:
-        """Executes the Squad's workflow for each input in the list and aggregates results."""
+    def kickoff_for_each(
+        self,
+        inputs: List[Dict[str, Any]],
+        batch_backend: Optional[BaseBatchBackend] = None,
+    ) -> List[SquadOutput]:
+        """Executes the Squad's workflow for each input in the list and aggregates results.
+
+        Args:
+            inputs: Inputs for each kickoff.
+            batch_backend: When set, the kickoffs run together and the pending LLM
+                request of every input is sent to this backend as one batch per step.
+        """
+        if batch_backend is not None:
+            return self._kickoff_for_each_batch(inputs, batch_backend)
+
         results: List[SquadOutput] = []
 
         # Initialize the parent squad's usage metrics
@@ -579,6 +617,56 @@ class Squad(BaseModel):
         self._mission_output_handler.reset()
         return results
 
+    def _kickoff_for_each_batch(
+        self, inputs: List[Dict[str, Any]], batch_backend: BaseBatchBackend
+    ) -> List[SquadOutput]:
+        """Runs one kickoff per input in lockstep, batching their LLM calls."""
+        if not inputs:
+            return []
+
+        coordinator = BatchCoordinator(backend=batch_backend, participants=len(inputs))
+        squad_copies = [self._batched_copy(coordinator) for _ in inputs]
+
+        def run_squad(squad: "Squad", input_data: Dict[str, Any]) -> SquadOutput:
+            try:
+                return squad.kickoff(inputs=input_data)
+            finally:
+                coordinator.leave()
+
+        with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+            futures = [
+                executor.submit(run_squad, squad, input_data)
+                for squad, input_data in zip(squad_copies, inputs)
+            ]
+            results = [future.result() for future in futures]
+
+        total_usage_metrics = UsageMetrics()
+        for squad in squad_copies:
+            if squad.usage_metrics:
+                total_usage_metrics.add_usage_metrics(squad.usage_metrics)
+
+        self.usage_metrics = total_usage_metrics
+        self._mission_output_handler.reset()
+        return results
+
+    def _batched_copy(self, coordinator: BatchCoordinator) -> "Squad":
+        """Copy the squad with every agent LLM routed through the batch coordinator."""
+        squad = self.copy()
+        for agent in squad.agents:
+            if isinstance(agent.llm, LLM):
+                agent.llm = BatchLLM(agent.llm, coordinator)
+
+        if squad.manager_agent and isinstance(squad.manager_agent.llm, LLM):
+            squad.manager_agent.llm = BatchLLM(squad.manager_agent.llm, coordinator)
+        elif isinstance(squad.manager_llm, (str, LLM)):
+            manager_llm = (
+                LLM(model=squad.manager_llm)
+                if isinstance(squad.manager_llm, str)
+                else squad.manager_llm
+            )
+            squad.manager_llm = BatchLLM(manager_llm, coordinator)
+        return squad
+
     async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = {}) -> SquadOutput:
         """Asynchronous kickoff method to start the squad execution."""
         return await asyncio.to_thread(self.kickoff, inputs)
@@ -712,6 +800,15 @@ class Squad(BaseModel):
                         last_sync_output = mission.output
                 continue
 
+            budget = self.usage_budget
+            if budget.is_exceeded():
+                self._logger.log(
+                    "warning",
+                    f"Stopping before mission '{mission.description}', {budget.describe()} exceeded.",
+                    color="red",
+                )
+                break
+
             agent_to_use = self._get_agent_to_use(mission)
             if agent_to_use is None:
                 raise ValueError(
@@ -1,21 +1,45 @@
+from typing import List, Optional
+
+import litellm
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.types.utils import Usage
 from moonai.agents.agent_builder.utilities.base_token_process import TokenProcess
 
 
 class TokenCalcHandler(CustomLogger):
-    def __init__(self, token_cost_process: TokenProcess):
+    def __init__(
+        self,
+        token_cost_process: TokenProcess,
+        linked_processes: Optional[List[TokenProcess]] = None,
+    ):
         self.token_cost_process = token_cost_process
+        # Mission and squad level processes that share the same usage, used to
+        # enforce budgets above the agent.
+        self.linked_processes = linked_processes or []
 
     def log_success_event(self, kwargs, response_obj, start_time, end_time):
         if self.token_cost_process is None:
             return
 
         usage : Usage = response_obj["usage"]
-        self.token_cost_process.sum_successful_requests(1)
-        self.token_cost_process.sum_prompt_tokens(usage.prompt_tokens)
-        self.token_cost_process.sum_completion_tokens(usage.completion_tokens)
-        if usage.prompt_tokens_details:
-            self.token_cost_process.sum_cached_prompt_tokens(
-                usage.prompt_tokens_details.cached_tokens
-            )
+        cost = self._response_cost(kwargs, response_obj)
+        for process in [self.token_cost_process, *self.linked_processes]:
+            process.sum_successful_requests(1)
+            process.sum_prompt_tokens(usage.prompt_tokens)
+            process.sum_completion_tokens(usage.completion_tokens)
+            process.sum_cost(cost)
+            if usage.prompt_tokens_details:
+                process.sum_cached_prompt_tokens(
+                    usage.prompt_tokens_details.cached_tokens
+                )
+
+    @staticmethod
+    def _response_cost(kwargs, response_obj) -> float:
+        """Price the call from litellm's model cost metadata, 0.0 if unknown."""
+        cost = kwargs.get("response_cost") if kwargs else None
+        if cost is None:
+            try:
+                cost = litellm.completion_cost(completion_response=response_obj)
+            except Exception:
+                cost = 0.0
+        return float(cost or 0.0)